@@ -1,48 +1,111 @@
+import io
+import mmap
+import multiprocessing
 import os
+import queue
+import re
+import sys
+import threading
 import tkinter as tk
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
+from functools import partial
 from tkinter import ttk, filedialog, messagebox
-from typing import List
+from typing import IO, Callable, Deque, Iterator, List, Optional, Tuple
 
 from pypdf import PdfReader, PdfWriter
 from pdf2docx import Converter
 import fitz  # PyMuPDF
-from PIL import Image
+from PIL import Image, TiffImagePlugin
 
 
-def parse_page_ranges(ranges: str, max_page: int) -> List[int]:
-    """Parse a page range string like "1-3,5,7-9" into a 0-based page index list.
-    max_page is the total number of pages in the PDF (1-based upper bound).
-    """
-    pages: List[int] = []
-    if not ranges:
-        return pages
-    parts = [p.strip() for p in ranges.split(',') if p.strip()]
-    for part in parts:
-        if '-' in part:
-            start_s, end_s = [x.strip() for x in part.split('-', 1)]
-            if not start_s.isdigit() or not end_s.isdigit():
+# one comma-separated entry of a page range string: "N", "N-M" or empty
+_RANGE_RE = re.compile(r"\s*(?:(\d+)\s*(?:-\s*(\d+)\s*)?)?(?:,|\Z)")
+# a whole range string that is just "N" or "N-M", the most common input
+_SINGLE_RANGE_RE = re.compile(r"\s*(\d+)\s*(?:-\s*(\d+)\s*)?")
+
+
+def _parse_ranges_text(ranges: str, max_page: int) -> List[Tuple[int, int]]:
+    """Parse and validate a page range string into 0-based half-open (start, end) pairs."""
+    pairs: List[Tuple[int, int]] = []
+    pos, length = 0, len(ranges)
+    while pos < length:
+        m = _RANGE_RE.match(ranges, pos)
+        if m is None:
+            part = ranges[pos:].split(',', 1)[0].strip()
+            if '-' in part:
                 raise ValueError(f"Invalid range: {part}")
+            raise ValueError(f"Invalid page: {part}")
+        pos = m.end()
+        start_s, end_s = m.group(1, 2)
+        if start_s is None:
+            continue
+        if end_s is not None:
             start, end = int(start_s), int(end_s)
             if start < 1 or end < 1 or start > end or end > max_page:
-                raise ValueError(f"Range out of bounds: {part}")
-            pages.extend(list(range(start - 1, end)))
+                raise ValueError(f"Range out of bounds: {m.group(0).rstrip(',').strip()}")
+            pairs.append((start - 1, end))
         else:
-            if not part.isdigit():
-                raise ValueError(f"Invalid page: {part}")
-            page = int(part)
+            page = int(start_s)
             if page < 1 or page > max_page:
-                raise ValueError(f"Page out of bounds: {part}")
-            pages.append(page - 1)
-    # de-duplicate while preserving order
-    seen = set()
+                raise ValueError(f"Page out of bounds: {m.group(0).rstrip(',').strip()}")
+            pairs.append((page - 1, page))
+    return pairs
+
+
+def _expand_and_dedup(pairs: List[Tuple[int, int]], max_page: int) -> List[int]:
+    """Expand (start, end) pairs into page indexes, dropping repeats while preserving order.
+    Pairs must already be validated against max_page.
+    """
+    seen = bytearray(max_page)
     unique_pages: List[int] = []
-    for p in pages:
-        if p not in seen:
-            seen.add(p)
-            unique_pages.append(p)
+    for start, end in pairs:
+        for p in range(start, end):
+            if not seen[p]:
+                seen[p] = 1
+                unique_pages.append(p)
     return unique_pages
 
 
+def parse_page_ranges(ranges: str, max_page: int) -> List[int]:
+    """Parse a page range string like "1-3,5,7-9" into a 0-based page index list.
+    max_page is the total number of pages in the PDF (1-based upper bound).
+    """
+    if not ranges:
+        return []
+    # a single in-bounds run or page needs no dedup; anything else, including
+    # out-of-bounds values, goes through the generic parser for its error messages
+    m = _SINGLE_RANGE_RE.fullmatch(ranges)
+    if m is not None:
+        start = int(m.group(1))
+        end = int(m.group(2)) if m.group(2) is not None else start
+        if 1 <= start <= end <= max_page:
+            return list(range(start - 1, end))
+    return _expand_and_dedup(_parse_ranges_text(ranges, max_page), max_page)
+
+
+@contextmanager
+def _open_pdf_stream(path: str) -> Iterator[IO[bytes]]:
+    """Open path for PdfReader, memory-mapped so the OS pages the file in on demand.
+    Falls back to the plain file handle on Windows / 32-bit builds, or when mmap refuses
+    the file (e.g. an empty one).
+    """
+    with open(path, "rb") as fh:
+        if os.name == "nt" or sys.maxsize <= 2 ** 32:
+            yield fh
+            return
+        try:
+            mm = mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ)
+        except (ValueError, OSError):
+            yield fh
+            return
+        try:
+            yield mm
+        finally:
+            mm.close()
+
+
 def split_pdf(input_path: str, ranges: str, output_dir: str) -> str:
     """Split a PDF by page ranges, producing a new PDF in output_dir.
     Returns the output file path.
@@ -52,15 +115,18 @@ def split_pdf(input_path: str, ranges: str, output_dir: str) -> str:
     if not os.path.isdir(output_dir):
         os.makedirs(output_dir, exist_ok=True)
 
-    reader = PdfReader(input_path)
-    total_pages = len(reader.pages)
-    page_indexes = parse_page_ranges(ranges, total_pages)
-    if not page_indexes:
-        raise ValueError("No pages to export. Provide ranges like '1-3,5'.")
+    with _open_pdf_stream(input_path) as stream:
+        reader = PdfReader(stream, strict=False)
+        # materialise the page list once so later lookups are plain list indexing
+        pages_cache = list(reader.pages)
+        total_pages = len(pages_cache)
+        page_indexes = parse_page_ranges(ranges, total_pages)
+        if not page_indexes:
+            raise ValueError("No pages to export. Provide ranges like '1-3,5'.")
 
-    writer = PdfWriter()
-    for idx in page_indexes:
-        writer.add_page(reader.pages[idx])
+        writer = PdfWriter()
+        for idx in page_indexes:
+            writer.add_page(pages_cache[idx])
 
     base = os.path.splitext(os.path.basename(input_path))[0]
     out_path = os.path.join(output_dir, f"{base}_split.pdf")
@@ -75,9 +141,12 @@ def merge_pdfs(input_paths: List[str], output_path: str) -> str:
     for p in input_paths:
         if not os.path.isfile(p):
             raise FileNotFoundError(p)
-        reader = PdfReader(p)
-        for page in reader.pages:
-            writer.add_page(page)
+        # append() clones the whole page tree in one pass; the clone holds no
+        # reference to the source file, so it can be closed right away
+        with _open_pdf_stream(p) as stream:
+            writer.append(PdfReader(stream))
+    # sources merged together often repeat the same fonts/images; keep one copy of each
+    writer.compress_identical_objects(remove_identicals=True, remove_orphans=True)
     out_dir = os.path.dirname(output_path) or os.getcwd()
     os.makedirs(out_dir, exist_ok=True)
     with open(output_path, "wb") as f:
@@ -99,49 +168,185 @@ def pdf_to_word(input_path: str, output_docx_path: str) -> str:
     return output_docx_path
 
 
-def pdf_to_images(input_path: str, output_dir: str, dpi: int = 300, image_format: str = "tiff") -> List[str]:
-    """Convert PDF pages to images. Returns list of image file paths."""
+# upper bound for parallel page rendering; more workers mostly add memory pressure
+_MAX_IMAGE_WORKERS = 4
+# encoded pages allowed to wait for the writer thread before rendering blocks
+_WRITE_QUEUE_SIZE = 4
+# documents up to this many pages are rendered in the calling process
+_MIN_POOL_PAGES = 10
+# above this DPI, JPEG is encoded by PIL with explicit chroma subsampling
+_HIGH_DPI_JPEG = 200
+# DPI cap applied to JPEG output when auto_dpi is on
+_AUTO_JPEG_DPI = 200
+# pages bigger than this skip JPEG optimize, which adds a second Huffman pass
+_LARGE_IMAGE_PIXELS = 4_000_000
+# write buffer for multipage TIFF output, so pages reach the disk in large chunks
+_MULTIPAGE_BUFFER_SIZE = 1 << 20
+
+
+def _image_executor(max_workers: int) -> ProcessPoolExecutor:
+    """Process pool for page rendering. PyMuPDF keeps the GIL while rendering and is not
+    thread-safe, so only processes give real parallelism. Workers are spawned rather than
+    forked because the caller may be a GUI worker thread, and forking a threaded process can deadlock.
+    """
+    return ProcessPoolExecutor(max_workers=max_workers, mp_context=multiprocessing.get_context("spawn"))
+
+
+def _render_page(input_path: str, page_num: int, zoom: float, image_format: str, dpi: int, output_dir: str) -> Tuple[str, bytes]:
+    """Render and encode one page. Returns (image file path, encoded bytes); writing is left to the caller.
+    The document is opened per call since PyMuPDF documents cannot be shared across workers.
+    """
+    doc = fitz.open(input_path)
+    try:
+        page = doc.load_page(page_num)
+        # 使用更高的颜色深度和抗锯齿
+        pix = page.get_pixmap(matrix=fitz.Matrix(zoom, zoom), alpha=False, colorspace="rgb")
+    finally:
+        doc.close()
+
+    # 根据格式选择保存参数
+    is_jpeg = image_format in ("jpg", "jpeg")
+    if image_format in ("tiff", "tif", "webp") or is_jpeg:
+        # MuPDF 不能输出 TIFF/WEBP；它的 JPEG 编码也远慢于 PIL
+        # samples_mv 是 pixmap 内存的视图，避免 pix.samples 先复制出一份 bytes
+        mode = "RGB"
+        img = Image.frombuffer(mode, (pix.width, pix.height), pix.samples_mv, "raw", mode, pix.stride, 1)
+        buf = io.BytesIO()
+        if image_format == "webp":
+            ext = "webp"
+            # WEBP高质量有损压缩：文件比PNG小，但编码比PNG慢
+            img.save(buf, format="WEBP", quality=95, method=4)
+        elif is_jpeg and dpi > _HIGH_DPI_JPEG:
+            ext = "jpg"
+            # 高DPI JPEG：4:2:0色度抽样，质量90；大图跳过optimize的二次编码
+            large = pix.width * pix.height > _LARGE_IMAGE_PIXELS
+            img.save(buf, format="JPEG", quality=90, subsampling=2, optimize=not large, dpi=(dpi, dpi))
+        elif is_jpeg:
+            ext = "jpg"
+            # JPEG高质量
+            img.save(buf, format="JPEG", quality=95, dpi=(dpi, dpi))
+        else:
+            ext = "tiff"
+            # TIFF无损压缩，LZW压缩
+            img.save(buf, format="TIFF", compression="tiff_lzw", dpi=(dpi, dpi))
+        out_path = os.path.join(output_dir, f"page_{page_num + 1}.{ext}")
+        return out_path, buf.getvalue()
+
+    # PNG 由 MuPDF 直接从 pixmap 单遍编码，省去复制到 PIL 的一次内存拷贝
+    pix.set_dpi(dpi, dpi)
+    ext = "png"
+    out_path = os.path.join(output_dir, f"page_{page_num + 1}.{ext}")
+    # PNG无损压缩
+    return out_path, pix.tobytes("png")
+
+
+def _write_images(pending: queue.Queue, errors: List[Exception], multipage_path: Optional[str] = None) -> None:
+    """Writer stage of pdf_to_images: save (path, data) items until a None sentinel.
+    With multipage_path, every page is appended to that single TIFF file instead.
+    After a failure it keeps draining so the producer never blocks on a full queue.
+    """
+    multipage_file = None
+    tiff = None
+    try:
+        while True:
+            item = pending.get()
+            if item is None:
+                return
+            if errors:
+                continue
+            out_path, data = item
+            try:
+                if multipage_path is None:
+                    with open(out_path, "wb") as f:
+                        f.write(data)
+                else:
+                    if tiff is None:
+                        multipage_file = open(multipage_path, "w+b", buffering=_MULTIPAGE_BUFFER_SIZE)
+                        tiff = TiffImagePlugin.AppendingTiffWriter(multipage_file)
+                    # each page is a complete TIFF; newFrame() rebases its offsets onto the file
+                    tiff.write(data)
+                    tiff.newFrame()
+            except Exception as e:
+                errors.append(e)
+    finally:
+        if multipage_file is not None:
+            try:
+                multipage_file.close()
+            except Exception as e:
+                errors.append(e)
+
+
+def pdf_to_images(input_path: str, output_dir: str, dpi: int = 300, image_format: str = "tiff", auto_dpi: bool = False,
+                  multipage_tiff: bool = False) -> List[str]:
+    """Convert PDF pages to images. Returns list of image file paths.
+    With auto_dpi, JPEG output is rendered at no more than 200 DPI, since the lossy
+    encode would discard most of the extra detail anyway.
+    With multipage_tiff and a TIFF format, all pages go into one <name>.tiff file,
+    which is the only path returned.
+    """
     if not os.path.isfile(input_path):
         raise FileNotFoundError(input_path)
     os.makedirs(output_dir, exist_ok=True)
 
     image_format = image_format.lower()
-    if image_format not in {"png", "jpg", "jpeg", "tiff", "tif"}:
-        raise ValueError("image_format must be png/jpg/jpeg/tiff/tif")
+    if image_format not in {"png", "jpg", "jpeg", "tiff", "tif", "webp"}:
+        raise ValueError("image_format must be png/jpg/jpeg/tiff/tif/webp")
+    if auto_dpi and image_format in ("jpg", "jpeg"):
+        dpi = min(dpi, _AUTO_JPEG_DPI)
 
-    doc = fitz.open(input_path)
-    output_files: List[str] = []
+    with fitz.open(input_path) as doc:
+        page_count = len(doc)
+    if page_count == 0:
+        return []
+
+    multipage_path = None
+    if multipage_tiff and image_format in ("tiff", "tif"):
+        base = os.path.splitext(os.path.basename(input_path))[0]
+        multipage_path = os.path.join(output_dir, f"{base}.tiff")
 
     # scale by DPI using a zoom matrix
     zoom = dpi / 72.0
-    mat = fitz.Matrix(zoom, zoom)
-
-    for page_num in range(len(doc)):
-        page = doc.load_page(page_num)
-        # 使用更高的颜色深度和抗锯齿
-        pix = page.get_pixmap(matrix=mat, alpha=False, colorspace="rgb")
-        mode = "RGB"
-        img = Image.frombytes(mode, [pix.width, pix.height], pix.samples)
-        
-        # 根据格式选择保存参数
-        if image_format in ("tiff", "tif"):
-            ext = "tiff"
-            out_path = os.path.join(output_dir, f"page_{page_num + 1}.{ext}")
-            # TIFF无损压缩，LZW压缩
-            img.save(out_path, format="TIFF", compression="tiff_lzw", dpi=(dpi, dpi))
-        elif image_format in ("jpg", "jpeg"):
-            ext = "jpg"
-            out_path = os.path.join(output_dir, f"page_{page_num + 1}.{ext}")
-            # JPEG高质量
-            img.save(out_path, format="JPEG", quality=100, optimize=True, dpi=(dpi, dpi))
-        else:  # png
-            ext = "png"
-            out_path = os.path.join(output_dir, f"page_{page_num + 1}.{ext}")
-            # PNG无损压缩
-            img.save(out_path, format="PNG", optimize=True, dpi=(dpi, dpi))
-        
-        output_files.append(out_path)
+    render = partial(_render_page, input_path, zoom=zoom, image_format=image_format, dpi=dpi, output_dir=output_dir)
 
+    # render+encode in the pool while a writer thread drains finished pages to disk;
+    # the bounded queue and in-flight window cap how many encoded pages sit in memory
+    workers = min(os.cpu_count() or 1, _MAX_IMAGE_WORKERS, page_count)
+    output_files: List[str] = []
+    errors: List[Exception] = []
+    pending: queue.Queue = queue.Queue(maxsize=_WRITE_QUEUE_SIZE)
+    writer = threading.Thread(target=_write_images, args=(pending, errors, multipage_path), daemon=True)
+    writer.start()
+    try:
+        if workers == 1 or page_count <= _MIN_POOL_PAGES:
+            # short documents: starting worker processes costs more than it saves
+            for page_num in range(page_count):
+                if errors:
+                    break
+                out_path, data = render(page_num)
+                pending.put((out_path, data))
+                output_files.append(out_path)
+        else:
+            with _image_executor(workers) as executor:
+                in_flight = deque()
+                next_page = 0
+                # a failed write ends the run: stop submitting and drop pages not yet started
+                while (next_page < page_count or in_flight) and not errors:
+                    while next_page < page_count and len(in_flight) < workers * 2:
+                        in_flight.append(executor.submit(render, next_page))
+                        next_page += 1
+                    # consume in submission order so output_files stays in page order
+                    out_path, data = in_flight.popleft().result()
+                    pending.put((out_path, data))
+                    output_files.append(out_path)
+                for future in in_flight:
+                    future.cancel()
+    finally:
+        pending.put(None)
+        writer.join()
+    if errors:
+        raise errors[0]
+    if multipage_path is not None:
+        return [multipage_path]
     return output_files
 
 
@@ -165,6 +370,13 @@ class PDFToolApp(tk.Tk):
         notebook.add(self.word_tab, text="转Word")
         notebook.add(self.image_tab, text="转图片")
 
+        # finished background tasks post (tab, ok, status_text, popup_title, popup_body) records here;
+        # only _drain_ui, on the Tk thread, turns them into widget updates
+        self._ui_queue: Deque[Tuple[str, bool, str, str, str]] = deque()
+        self._task_buttons = {"split": self.split_button, "merge": self.merge_button, "word": self.word_button, "image": self.img_button}
+        self._task_status = {"split": self.split_status, "merge": self.merge_status, "word": self.word_status, "image": self.img_status}
+        self.after(100, self._drain_ui)
+
     # --- Split Tab ---
     def _build_split_tab(self, parent: ttk.Notebook):
         frame = ttk.Frame(parent, padding=12)
@@ -183,7 +395,8 @@ class PDFToolApp(tk.Tk):
         ttk.Entry(frame, textvariable=self.split_out_dir, width=70).grid(row=2, column=1, padx=6, pady=(8, 0))
         ttk.Button(frame, text="选择", command=self._choose_split_outdir).grid(row=2, column=2, pady=(8, 0))
 
-        ttk.Button(frame, text="开始拆分", command=self._do_split).grid(row=3, column=1, pady=16)
+        self.split_button = ttk.Button(frame, text="开始拆分", command=self._do_split)
+        self.split_button.grid(row=3, column=1, pady=16)
 
         self.split_status = tk.StringVar(value="就绪")
         ttk.Label(frame, textvariable=self.split_status, foreground="#666").grid(row=4, column=0, columnspan=3, sticky=tk.W)
@@ -203,12 +416,8 @@ class PDFToolApp(tk.Tk):
             self.split_out_dir.set(path)
 
     def _do_split(self):
-        try:
-            out = split_pdf(self.split_pdf_path.get(), self.split_ranges.get(), self.split_out_dir.get())
-            self.split_status.set(f"完成：{out}")
-            messagebox.showinfo("完成", f"已输出：\n{out}")
-        except Exception as e:
-            messagebox.showerror("错误", str(e))
+        work = partial(split_pdf, self.split_pdf_path.get(), self.split_ranges.get(), self.split_out_dir.get())
+        self._run_task("split", work, lambda out: (f"完成：{out}", "完成", f"已输出：\n{out}"))
 
     # --- Merge Tab ---
     def _build_merge_tab(self, parent: ttk.Notebook):
@@ -227,7 +436,8 @@ class PDFToolApp(tk.Tk):
         ttk.Entry(frame, textvariable=self.merge_out_path, width=70).grid(row=3, column=1, padx=6)
         ttk.Button(frame, text="选择", command=self._choose_merge_outfile).grid(row=3, column=2)
 
-        ttk.Button(frame, text="开始合并", command=self._do_merge).grid(row=4, column=1, pady=16)
+        self.merge_button = ttk.Button(frame, text="开始合并", command=self._do_merge)
+        self.merge_button.grid(row=4, column=1, pady=16)
 
         self.merge_status = tk.StringVar(value="就绪")
         ttk.Label(frame, textvariable=self.merge_status, foreground="#666").grid(row=5, column=0, columnspan=3, sticky=tk.W)
@@ -258,13 +468,9 @@ class PDFToolApp(tk.Tk):
             self.merge_out_path.set(path)
 
     def _do_merge(self):
-        try:
-            files = list(self.merge_listbox.get(0, tk.END))
-            out = merge_pdfs(files, self.merge_out_path.get())
-            self.merge_status.set(f"完成：{out}")
-            messagebox.showinfo("完成", f"已输出：\n{out}")
-        except Exception as e:
-            messagebox.showerror("错误", str(e))
+        files = list(self.merge_listbox.get(0, tk.END))
+        work = partial(merge_pdfs, files, self.merge_out_path.get())
+        self._run_task("merge", work, lambda out: (f"完成：{out}", "完成", f"已输出：\n{out}"))
 
     # --- Word Tab ---
     def _build_word_tab(self, parent: ttk.Notebook):
@@ -280,7 +486,8 @@ class PDFToolApp(tk.Tk):
         ttk.Entry(frame, textvariable=self.word_out_path, width=70).grid(row=1, column=1, padx=6, pady=(8, 0))
         ttk.Button(frame, text="选择", command=self._choose_word_outfile).grid(row=1, column=2, pady=(8, 0))
 
-        ttk.Button(frame, text="开始转换", command=self._do_word).grid(row=2, column=1, pady=16)
+        self.word_button = ttk.Button(frame, text="开始转换", command=self._do_word)
+        self.word_button.grid(row=2, column=1, pady=16)
 
         self.word_status = tk.StringVar(value="就绪")
         ttk.Label(frame, textvariable=self.word_status, foreground="#666").grid(row=3, column=0, columnspan=3, sticky=tk.W)
@@ -298,12 +505,8 @@ class PDFToolApp(tk.Tk):
             self.word_out_path.set(path)
 
     def _do_word(self):
-        try:
-            out = pdf_to_word(self.word_pdf_path.get(), self.word_out_path.get())
-            self.word_status.set(f"完成：{out}")
-            messagebox.showinfo("完成", f"已输出：\n{out}")
-        except Exception as e:
-            messagebox.showerror("错误", str(e))
+        work = partial(pdf_to_word, self.word_pdf_path.get(), self.word_out_path.get())
+        self._run_task("word", work, lambda out: (f"完成：{out}", "完成", f"已输出：\n{out}"))
 
     # --- Image Tab ---
     def _build_image_tab(self, parent: ttk.Notebook):
@@ -320,28 +523,35 @@ class PDFToolApp(tk.Tk):
 
         ttk.Label(frame, text="图片格式：").grid(row=1, column=1, sticky=tk.E, pady=(8, 0))
         self.img_fmt = tk.StringVar(value="tiff")
-        ttk.Combobox(frame, textvariable=self.img_fmt, values=["tiff", "png", "jpg"], width=8, state="readonly").grid(row=1, column=2, sticky=tk.W, pady=(8, 0))
+        ttk.Combobox(frame, textvariable=self.img_fmt, values=["tiff", "png", "jpg", "webp"], width=8, state="readonly").grid(row=1, column=2, sticky=tk.W, pady=(8, 0))
 
-        ttk.Label(frame, text="输出文件夹：").grid(row=2, column=0, sticky=tk.W, pady=(8, 0))
+        self.img_auto_dpi = tk.BooleanVar(value=False)
+        ttk.Checkbutton(frame, text="JPG 自动限制 DPI（不超过 200）", variable=self.img_auto_dpi).grid(row=2, column=1, sticky=tk.W, pady=(8, 0))
+        self.img_multipage = tk.BooleanVar(value=False)
+        ttk.Checkbutton(frame, text="TIFF 合并为多页文件", variable=self.img_multipage).grid(row=2, column=1, sticky=tk.E, pady=(8, 0))
+
+        ttk.Label(frame, text="输出文件夹：").grid(row=3, column=0, sticky=tk.W, pady=(8, 0))
         self.img_out_dir = tk.StringVar()
-        ttk.Entry(frame, textvariable=self.img_out_dir, width=70).grid(row=2, column=1, padx=6, pady=(8, 0))
-        ttk.Button(frame, text="选择", command=self._choose_img_outdir).grid(row=2, column=2, pady=(8, 0))
+        ttk.Entry(frame, textvariable=self.img_out_dir, width=70).grid(row=3, column=1, padx=6, pady=(8, 0))
+        ttk.Button(frame, text="选择", command=self._choose_img_outdir).grid(row=3, column=2, pady=(8, 0))
 
-        ttk.Button(frame, text="开始转换", command=self._do_images).grid(row=3, column=1, pady=16)
+        self.img_button = ttk.Button(frame, text="开始转换", command=self._do_images)
+        self.img_button.grid(row=4, column=1, pady=16)
 
         self.img_status = tk.StringVar(value="就绪")
-        ttk.Label(frame, textvariable=self.img_status, foreground="#666").grid(row=4, column=0, columnspan=3, sticky=tk.W)
+        ttk.Label(frame, textvariable=self.img_status, foreground="#666").grid(row=5, column=0, columnspan=3, sticky=tk.W)
 
         # 添加使用建议
-        ttk.Separator(frame, orient='horizontal').grid(row=5, column=0, columnspan=3, sticky='ew', pady=10)
+        ttk.Separator(frame, orient='horizontal').grid(row=6, column=0, columnspan=3, sticky='ew', pady=10)
         
         tips_frame = ttk.LabelFrame(frame, text="使用建议", padding=8)
-        tips_frame.grid(row=6, column=0, columnspan=3, sticky='ew', pady=(0, 10))
+        tips_frame.grid(row=7, column=0, columnspan=3, sticky='ew', pady=(0, 10))
         
         tips_text = """专业印刷：使用TIFF格式，DPI设置为300-600
 高质量存档：使用TIFF或PNG格式，DPI设置为300
 网页使用：使用PNG格式，DPI设置为200-300
-一般用途：使用JPEG格式，DPI设置为200-300"""
+一般用途：使用JPEG格式，DPI设置为200-300
+节省空间：使用WEBP格式，文件通常比PNG小（转换较慢）"""
         
         tips_label = ttk.Label(tips_frame, text=tips_text, justify=tk.LEFT, foreground="#666")
         tips_label.grid(row=0, column=0, sticky='w')
@@ -360,14 +570,48 @@ class PDFToolApp(tk.Tk):
 
     def _do_images(self):
         try:
-            files = pdf_to_images(self.img_pdf_path.get(), self.img_out_dir.get(), dpi=int(self.img_dpi.get()), image_format=self.img_fmt.get())
-            self.img_status.set(f"完成：{len(files)} 张图片")
-            messagebox.showinfo("完成", f"共输出 {len(files)} 张图片。\n示例：\n{files[0] if files else ''}")
+            dpi = int(self.img_dpi.get())
         except Exception as e:
             messagebox.showerror("错误", str(e))
+            return
+        work = partial(pdf_to_images, self.img_pdf_path.get(), self.img_out_dir.get(), dpi=dpi, image_format=self.img_fmt.get(),
+                       auto_dpi=self.img_auto_dpi.get(), multipage_tiff=self.img_multipage.get())
+
+        def describe(files):
+            return f"完成：{len(files)} 张图片", "完成", f"共输出 {len(files)} 张图片。\n示例：\n{files[0] if files else ''}"
+
+        self._run_task("image", work, describe)
+
+    # --- Background tasks ---
+    def _run_task(self, tab: str, work: Callable[[], object], describe: Callable[[object], Tuple[str, str, str]]) -> None:
+        """Run work() on a worker thread so the window stays responsive.
+        describe(result) builds the (status_text, popup_title, popup_body) shown for the tab.
+        """
+        self._task_buttons[tab].state(["disabled"])
+        self._task_status[tab].set("处理中…")
+
+        def runner():
+            try:
+                record = (tab, True, *describe(work()))
+            except Exception as e:
+                record = (tab, False, "失败", "错误", str(e))
+            self._ui_queue.append(record)
+
+        threading.Thread(target=runner, daemon=True).start()
+
+    def _drain_ui(self) -> None:
+        while self._ui_queue:
+            tab, ok, status_text, popup_title, popup_body = self._ui_queue.popleft()
+            self._task_buttons[tab].state(["!disabled"])
+            self._task_status[tab].set(status_text)
+            show = messagebox.showinfo if ok else messagebox.showerror
+            show(popup_title, popup_body)
+        self.after(100, self._drain_ui)
 
 
 if __name__ == "__main__":
+    # lets the frozen exe act as a page-rendering worker instead of opening another window
+    multiprocessing.freeze_support()
     app = PDFToolApp()
     app.mainloop()
 
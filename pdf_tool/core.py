@@ -1,5 +1,15 @@
+import io
+import mmap
 import os
-from typing import List, Tuple
+import queue
+import re
+import sys
+import threading
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
+from functools import partial
+from typing import IO, Iterator, List, Tuple
 
 from pypdf import PdfReader, PdfWriter
 from pdf2docx import Converter
@@ -7,40 +17,92 @@ import fitz  # PyMuPDF
 from PIL import Image
 
 
-def parse_page_ranges(ranges: str, max_page: int) -> List[int]:
-    """Parse a page range string like "1-3,5,7-9" into a 0-based page index list.
-    max_page is the total number of pages in the PDF (1-based upper bound).
-    """
-    pages: List[int] = []
-    if not ranges:
-        return pages
-    parts = [p.strip() for p in ranges.split(',') if p.strip()]
-    for part in parts:
-        if '-' in part:
-            start_s, end_s = [x.strip() for x in part.split('-', 1)]
-            if not start_s.isdigit() or not end_s.isdigit():
+# one comma-separated entry of a page range string: "N", "N-M" or empty
+_RANGE_RE = re.compile(r"\s*(?:(\d+)\s*(?:-\s*(\d+)\s*)?)?(?:,|\Z)")
+# a whole range string that is just "N" or "N-M", the most common input
+_SINGLE_RANGE_RE = re.compile(r"\s*(\d+)\s*(?:-\s*(\d+)\s*)?")
+
+
+def _parse_ranges_text(ranges: str, max_page: int) -> List[Tuple[int, int]]:
+    """Parse and validate a page range string into 0-based half-open (start, end) pairs."""
+    pairs: List[Tuple[int, int]] = []
+    pos, length = 0, len(ranges)
+    while pos < length:
+        m = _RANGE_RE.match(ranges, pos)
+        if m is None:
+            part = ranges[pos:].split(',', 1)[0].strip()
+            if '-' in part:
                 raise ValueError(f"Invalid range: {part}")
+            raise ValueError(f"Invalid page: {part}")
+        pos = m.end()
+        start_s, end_s = m.group(1, 2)
+        if start_s is None:
+            continue
+        if end_s is not None:
             start, end = int(start_s), int(end_s)
             if start < 1 or end < 1 or start > end or end > max_page:
-                raise ValueError(f"Range out of bounds: {part}")
-            pages.extend(list(range(start - 1, end)))
+                raise ValueError(f"Range out of bounds: {m.group(0).rstrip(',').strip()}")
+            pairs.append((start - 1, end))
         else:
-            if not part.isdigit():
-                raise ValueError(f"Invalid page: {part}")
-            page = int(part)
+            page = int(start_s)
             if page < 1 or page > max_page:
-                raise ValueError(f"Page out of bounds: {part}")
-            pages.append(page - 1)
-    # de-duplicate while preserving order
-    seen = set()
+                raise ValueError(f"Page out of bounds: {m.group(0).rstrip(',').strip()}")
+            pairs.append((page - 1, page))
+    return pairs
+
+
+def _expand_and_dedup(pairs: List[Tuple[int, int]], max_page: int) -> List[int]:
+    """Expand (start, end) pairs into page indexes, dropping repeats while preserving order.
+    Pairs must already be validated against max_page.
+    """
+    seen = bytearray(max_page)
     unique_pages: List[int] = []
-    for p in pages:
-        if p not in seen:
-            seen.add(p)
-            unique_pages.append(p)
+    for start, end in pairs:
+        for p in range(start, end):
+            if not seen[p]:
+                seen[p] = 1
+                unique_pages.append(p)
     return unique_pages
 
 
+def parse_page_ranges(ranges: str, max_page: int) -> List[int]:
+    """Parse a page range string like "1-3,5,7-9" into a 0-based page index list.
+    max_page is the total number of pages in the PDF (1-based upper bound).
+    """
+    if not ranges:
+        return []
+    # a single in-bounds run or page needs no dedup; anything else, including
+    # out-of-bounds values, goes through the generic parser for its error messages
+    m = _SINGLE_RANGE_RE.fullmatch(ranges)
+    if m is not None:
+        start = int(m.group(1))
+        end = int(m.group(2)) if m.group(2) is not None else start
+        if 1 <= start <= end <= max_page:
+            return list(range(start - 1, end))
+    return _expand_and_dedup(_parse_ranges_text(ranges, max_page), max_page)
+
+
+@contextmanager
+def _open_pdf_stream(path: str) -> Iterator[IO[bytes]]:
+    """Open path for PdfReader, memory-mapped so the OS pages the file in on demand.
+    Falls back to the plain file handle on Windows / 32-bit builds, or when mmap refuses
+    the file (e.g. an empty one).
+    """
+    with open(path, "rb") as fh:
+        if os.name == "nt" or sys.maxsize <= 2 ** 32:
+            yield fh
+            return
+        try:
+            mm = mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ)
+        except (ValueError, OSError):
+            yield fh
+            return
+        try:
+            yield mm
+        finally:
+            mm.close()
+
+
 def split_pdf(input_path: str, ranges: str, output_dir: str) -> str:
     """Split a PDF by page ranges, producing a new PDF in output_dir.
     Returns the output file path.
@@ -50,15 +112,18 @@ def split_pdf(input_path: str, ranges: str, output_dir: str) -> str:
     if not os.path.isdir(output_dir):
         os.makedirs(output_dir, exist_ok=True)
 
-    reader = PdfReader(input_path)
-    total_pages = len(reader.pages)
-    page_indexes = parse_page_ranges(ranges, total_pages)
-    if not page_indexes:
-        raise ValueError("No pages to export. Provide ranges like '1-3,5'.")
+    with _open_pdf_stream(input_path) as stream:
+        reader = PdfReader(stream, strict=False)
+        # materialise the page list once so later lookups are plain list indexing
+        pages_cache = list(reader.pages)
+        total_pages = len(pages_cache)
+        page_indexes = parse_page_ranges(ranges, total_pages)
+        if not page_indexes:
+            raise ValueError("No pages to export. Provide ranges like '1-3,5'.")
 
-    writer = PdfWriter()
-    for idx in page_indexes:
-        writer.add_page(reader.pages[idx])
+        writer = PdfWriter()
+        for idx in page_indexes:
+            writer.add_page(pages_cache[idx])
 
     base = os.path.splitext(os.path.basename(input_path))[0]
     out_path = os.path.join(output_dir, f"{base}_split.pdf")
@@ -73,9 +138,12 @@ def merge_pdfs(input_paths: List[str], output_path: str) -> str:
     for p in input_paths:
         if not os.path.isfile(p):
             raise FileNotFoundError(p)
-        reader = PdfReader(p)
-        for page in reader.pages:
-            writer.add_page(page)
+        # append() clones the whole page tree in one pass; the clone holds no
+        # reference to the source file, so it can be closed right away
+        with _open_pdf_stream(p) as stream:
+            writer.append(PdfReader(stream))
+    # sources merged together often repeat the same fonts/images; keep one copy of each
+    writer.compress_identical_objects(remove_identicals=True, remove_orphans=True)
     out_dir = os.path.dirname(output_path) or os.getcwd()
     os.makedirs(out_dir, exist_ok=True)
     with open(output_path, "wb") as f:
@@ -97,8 +165,84 @@ def pdf_to_word(input_path: str, output_docx_path: str) -> str:
     return output_docx_path
 
 
-def pdf_to_images(input_path: str, output_dir: str, dpi: int = 200, image_format: str = "png") -> List[str]:
-    """Convert PDF pages to images. Returns list of image file paths."""
+# upper bound for parallel page rendering; more workers mostly add memory pressure
+_MAX_IMAGE_WORKERS = 4
+# encoded pages allowed to wait for the writer thread before rendering blocks
+_WRITE_QUEUE_SIZE = 4
+# documents up to this many pages are rendered in the calling process
+_MIN_POOL_PAGES = 10
+# above this DPI, JPEG is encoded with 4:2:0 chroma subsampling at quality 90
+_HIGH_DPI_JPEG = 200
+# DPI cap applied to JPEG output when auto_dpi is on
+_AUTO_JPEG_DPI = 200
+# pages bigger than this skip JPEG optimize, which adds a second Huffman pass
+_LARGE_IMAGE_PIXELS = 4_000_000
+
+
+def _image_executor(max_workers: int) -> ProcessPoolExecutor:
+    """Process pool for page rendering. PyMuPDF keeps the GIL while rendering and is not
+    thread-safe, so only processes give real parallelism.
+    """
+    return ProcessPoolExecutor(max_workers=max_workers)
+
+
+def _render_page(input_path: str, page_num: int, zoom: float, image_format: str, dpi: int, output_dir: str) -> Tuple[str, bytes]:
+    """Render and encode one page. Returns (image file path, encoded bytes); writing is left to the caller.
+    The document is opened per call since PyMuPDF documents cannot be shared across workers.
+    """
+    doc = fitz.open(input_path)
+    try:
+        page = doc.load_page(page_num)
+        pix = page.get_pixmap(matrix=fitz.Matrix(zoom, zoom), alpha=False)
+    finally:
+        doc.close()
+    ext = "jpg" if image_format in ("jpg", "jpeg") else "png"
+    out_path = os.path.join(output_dir, f"page_{page_num + 1}.{ext}")
+    if ext == "jpg":
+        # MuPDF's JPEG encoder is far slower than PIL's; samples_mv views the pixmap
+        # memory, so PIL reads it without an intermediate bytes copy
+        mode = "RGB"
+        img = Image.frombuffer(mode, (pix.width, pix.height), pix.samples_mv, "raw", mode, pix.stride, 1)
+        buf = io.BytesIO()
+        if dpi > _HIGH_DPI_JPEG:
+            # at high DPI full-resolution chroma adds size without visible detail
+            large = pix.width * pix.height > _LARGE_IMAGE_PIXELS
+            img.save(buf, format="JPEG", quality=90, subsampling=2, optimize=not large, dpi=(dpi, dpi))
+        else:
+            img.save(buf, format="JPEG", quality=95, dpi=(dpi, dpi))
+        return out_path, buf.getvalue()
+    # MuPDF encodes PNG straight from the pixmap buffer in a single pass;
+    # set_dpi makes it record the resolution in the PNG header
+    pix.set_dpi(dpi, dpi)
+    return out_path, pix.tobytes("png")
+
+
+def _write_images(pending: queue.Queue, errors: List[Exception]) -> None:
+    """Writer stage of pdf_to_images: save (path, data) items until a None sentinel.
+    After a failure it keeps draining so the producer never blocks on a full queue.
+    """
+    while True:
+        item = pending.get()
+        if item is None:
+            return
+        if errors:
+            continue
+        out_path, data = item
+        try:
+            with open(out_path, "wb") as f:
+                f.write(data)
+        except Exception as e:
+            errors.append(e)
+
+
+def pdf_to_images(input_path: str, output_dir: str, dpi: int = 200, image_format: str = "png",
+                  auto_dpi: bool = False) -> List[str]:
+    """Convert PDF pages to images. Returns list of image file paths.
+    With auto_dpi, JPEG output is rendered at no more than 200 DPI, since the lossy
+    encode would discard most of the extra detail anyway.
+    Documents longer than 10 pages are rendered in worker processes; where those are
+    spawned (Windows, macOS) the calling script needs an ``if __name__ == "__main__":`` guard.
+    """
     if not os.path.isfile(input_path):
         raise FileNotFoundError(input_path)
     os.makedirs(output_dir, exist_ok=True)
@@ -106,24 +250,55 @@ def pdf_to_images(input_path: str, output_dir: str, dpi: int = 200, image_format
     image_format = image_format.lower()
     if image_format not in {"png", "jpg", "jpeg"}:
         raise ValueError("image_format must be png/jpg/jpeg")
+    if auto_dpi and image_format in ("jpg", "jpeg"):
+        dpi = min(dpi, _AUTO_JPEG_DPI)
 
-    doc = fitz.open(input_path)
-    output_files: List[str] = []
+    with fitz.open(input_path) as doc:
+        page_count = len(doc)
+    if page_count == 0:
+        return []
 
     # scale by DPI using a zoom matrix
     zoom = dpi / 72.0
-    mat = fitz.Matrix(zoom, zoom)
-
-    for page_num in range(len(doc)):
-        page = doc.load_page(page_num)
-        pix = page.get_pixmap(matrix=mat, alpha=False)
-        mode = "RGB"
-        img = Image.frombytes(mode, [pix.width, pix.height], pix.samples)
-        ext = "jpg" if image_format in ("jpg", "jpeg") else "png"
-        out_path = os.path.join(output_dir, f"page_{page_num + 1}.{ext}")
-        img.save(out_path, quality=95)
-        output_files.append(out_path)
+    render = partial(_render_page, input_path, zoom=zoom, image_format=image_format, dpi=dpi, output_dir=output_dir)
 
+    # render+encode in the pool while a writer thread drains finished pages to disk;
+    # the bounded queue and in-flight window cap how many encoded pages sit in memory
+    workers = min(os.cpu_count() or 1, _MAX_IMAGE_WORKERS, page_count)
+    output_files: List[str] = []
+    errors: List[Exception] = []
+    pending: queue.Queue = queue.Queue(maxsize=_WRITE_QUEUE_SIZE)
+    writer = threading.Thread(target=_write_images, args=(pending, errors), daemon=True)
+    writer.start()
+    try:
+        if workers == 1 or page_count <= _MIN_POOL_PAGES:
+            # short documents: starting worker processes costs more than it saves
+            for page_num in range(page_count):
+                if errors:
+                    break
+                out_path, data = render(page_num)
+                pending.put((out_path, data))
+                output_files.append(out_path)
+        else:
+            with _image_executor(workers) as executor:
+                in_flight = deque()
+                next_page = 0
+                # a failed write ends the run: stop submitting and drop pages not yet started
+                while (next_page < page_count or in_flight) and not errors:
+                    while next_page < page_count and len(in_flight) < workers * 2:
+                        in_flight.append(executor.submit(render, next_page))
+                        next_page += 1
+                    # consume in submission order so output_files stays in page order
+                    out_path, data = in_flight.popleft().result()
+                    pending.put((out_path, data))
+                    output_files.append(out_path)
+                for future in in_flight:
+                    future.cancel()
+    finally:
+        pending.put(None)
+        writer.join()
+    if errors:
+        raise errors[0]
     return output_files
 
 